@@ -1,27 +1,38 @@
 """ The task library entrypoint.
+
+Task classes are only imported from their submodules the first time they are
+accessed (PEP 562), so that importing the package itself stays cheap.
 """
+import importlib
+from typing import Any, List
+
 from ._version import __version__
-from .base import (
-    BinarizedTask,
-    BinaryTask,
-    HybridTask,
-    Mask,
-    Task,
-    TaskMask,
-    TaskType,
-    TokenTask,
-)
-from .language import (
-    AdjectiveLanguage,
-    AdjectiveLanguageCounting,
-    ElementaryLanguage,
-    ElementaryLanguageWithWorldDef,
-    ElementaryLanguageWithWorldDefCounting,
-    HarderElementaryLanguage,
-)
-from .periodic import IncreasingPeriod, Periodic, RandomPeriodic
-from .symbolic import HardSymbolCounting, SymbolCounting
 
+_NAME_TO_MODULE = {
+    "Task": ".base",
+    "BinarizedTask": ".base",
+    "TokenTask": ".base",
+    "BinaryTask": ".base",
+    "TaskMask": ".base",
+    "Mask": ".base",
+    "HybridTask": ".base",
+    "TaskType": ".base",
+    "SymbolCounting": ".symbolic",
+    "HardSymbolCounting": ".symbolic",
+    "Periodic": ".periodic",
+    "IncreasingPeriod": ".periodic",
+    "RandomPeriodic": ".periodic",
+    "ElementaryLanguage": ".language",
+    "ElementaryLanguageWithWorldDef": ".language",
+    "ElementaryLanguageWithWorldDefCounting": ".language",
+    "HarderElementaryLanguage": ".language",
+    "AdjectiveLanguage": ".language",
+    "AdjectiveLanguageCounting": ".language",
+    "seed": "._rng",
+}
+
+# The names are provided by `__getattr__` below
+# pylint: disable=undefined-all-variable
 __all__ = [
     "Task",
     "BinarizedTask",
@@ -42,21 +53,27 @@ __all__ = [
     "HybridTask",
     "TaskType",
     "AdjectiveLanguageCounting",
+    "seed",
+    "get_task_class",
     "__version__",
 ]
+# pylint: enable=undefined-all-variable
 
-ID_TO_TASK = {
-    1: Periodic,
-    2: IncreasingPeriod,
-    5: ElementaryLanguage,
-    3: SymbolCounting,
-    4: HardSymbolCounting,
-    6: HarderElementaryLanguage,
-    7: ElementaryLanguageWithWorldDef,
-    8: ElementaryLanguageWithWorldDefCounting,
-    9: AdjectiveLanguage,
-    10: AdjectiveLanguageCounting,
-}
+# Names of the task classes indexed by task ID (there is no task 0). They are
+# only resolved to the actual classes when needed.
+_TASK_NAMES_BY_ID = (
+    "",
+    "Periodic",
+    "IncreasingPeriod",
+    "SymbolCounting",
+    "HardSymbolCounting",
+    "ElementaryLanguage",
+    "HarderElementaryLanguage",
+    "ElementaryLanguageWithWorldDef",
+    "ElementaryLanguageWithWorldDefCounting",
+    "AdjectiveLanguage",
+    "AdjectiveLanguageCounting",
+)
 
 ID_TO_PRETTY_NAME = {
     1: "Periodic",
@@ -83,3 +100,36 @@ NAME_TO_ID = {
     "adj-qa": 9,
     "adj-qa-ct": 10,
 }
+
+
+def get_task_class(task_id: int) -> Any:
+    """Returns the task class with ID `task_id`, only importing the submodule
+    that defines it."""
+    if not 0 < task_id < len(_TASK_NAMES_BY_ID):
+        raise KeyError(task_id)
+    return __getattr__(_TASK_NAMES_BY_ID[task_id])
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import the public names of the package."""
+    if name == "ID_TO_TASK":
+        value: Any = {
+            task_id: __getattr__(task_name)
+            for task_id, task_name in enumerate(_TASK_NAMES_BY_ID)
+            if task_name
+        }
+    elif name in _NAME_TO_MODULE:
+        module = importlib.import_module(_NAME_TO_MODULE[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache the value so that `__getattr__` is only called once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(
+        set(__all__)
+        | {"ID_TO_TASK", "ID_TO_PRETTY_NAME", "NAME_TO_ID", "get_task_class"}
+    )
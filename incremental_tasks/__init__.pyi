@@ -0,0 +1,33 @@
+from typing import Dict, List, Type
+
+from ._rng import seed as seed
+from ._version import __version__ as __version__
+from .base import BinarizedTask as BinarizedTask
+from .base import BinaryTask as BinaryTask
+from .base import HybridTask as HybridTask
+from .base import Mask as Mask
+from .base import Task as Task
+from .base import TaskMask as TaskMask
+from .base import TaskType as TaskType
+from .base import TokenTask as TokenTask
+from .language import AdjectiveLanguage as AdjectiveLanguage
+from .language import AdjectiveLanguageCounting as AdjectiveLanguageCounting
+from .language import ElementaryLanguage as ElementaryLanguage
+from .language import ElementaryLanguageWithWorldDef as ElementaryLanguageWithWorldDef
+from .language import (
+    ElementaryLanguageWithWorldDefCounting as ElementaryLanguageWithWorldDefCounting,
+)
+from .language import HarderElementaryLanguage as HarderElementaryLanguage
+from .periodic import IncreasingPeriod as IncreasingPeriod
+from .periodic import Periodic as Periodic
+from .periodic import RandomPeriodic as RandomPeriodic
+from .symbolic import HardSymbolCounting as HardSymbolCounting
+from .symbolic import SymbolCounting as SymbolCounting
+
+__all__: List[str]
+
+ID_TO_TASK: Dict[int, Type[Task]]
+ID_TO_PRETTY_NAME: Dict[int, str]
+NAME_TO_ID: Dict[str, int]
+
+def get_task_class(task_id: int) -> Type[Task]: ...
@@ -0,0 +1,56 @@
+"""Random number generators of the tasks.
+
+The tasks drawing their sequences with numpy get their own generator, spawned
+from a module-level root `SeedSequence`, so that the random streams of
+different instances (or worker processes) never overlap. The other tasks draw
+from the global `random` module. `seed` seeds both, which makes all the tasks
+created afterwards reproducible.
+"""
+import random
+from typing import List, Optional, Union
+
+import numpy as np
+
+# Seed of a task: an integer or a node of a `SeedSequence` spawn tree
+Seed = Union[int, np.random.SeedSequence]
+
+_root = np.random.SeedSequence()
+
+
+def seed(entropy: Optional[int] = None):
+    """Resets the root `SeedSequence` the generators of new task instances are
+    spawned from and seeds the `random` module (with fresh entropy if `entropy`
+    is `None`)."""
+    global _root  # pylint: disable=global-statement
+    random.seed(entropy)
+    _root = np.random.SeedSequence(entropy)
+
+
+def new_rng(entropy: Optional[Seed] = None) -> np.random.Generator:
+    """Returns a new numpy `Generator` for a task instance, seeded with
+    `entropy` or spawned from the root `SeedSequence` without it."""
+    if entropy is None:
+        return np.random.default_rng(_root.spawn(1)[0])
+    return np.random.default_rng(entropy)
+
+
+def spawn_seeds(
+    n_seeds: int, entropy: Optional[int] = None
+) -> List[np.random.SeedSequence]:
+    """Returns `n_seeds` independent child `SeedSequence`s, spawned from
+    `entropy` or from the root `SeedSequence` without it."""
+    root = _root if entropy is None else np.random.SeedSequence(entropy)
+    return root.spawn(n_seeds)
+
+
+def child_seed(parent: np.random.SeedSequence, key: int) -> np.random.SeedSequence:
+    """Returns the child `key` of `parent` in its spawn tree. Unlike
+    `SeedSequence.spawn`, the same child is returned on every call."""
+    return np.random.SeedSequence(
+        parent.entropy, spawn_key=(*parent.spawn_key, key), pool_size=parent.pool_size
+    )
+
+
+def random_seed(seed_seq: np.random.SeedSequence) -> int:
+    """Derives a seed for the `random` module from a `SeedSequence`."""
+    return int(seed_seq.generate_state(1, np.uint64)[0])
@@ -1,7 +1,7 @@
-"""Store the version of the package within source code."""
-import importlib.metadata
+"""Store the version of the package within source code.
 
-try:
-    __version__ = importlib.metadata.version("incremental_tasks")
-except importlib.metadata.PackageNotFoundError:
-    __version__ = "not-installed"
+This is kept as a constant rather than read from the installed distribution
+metadata to keep the import cheap. It must be bumped together with the version
+in `pyproject.toml`.
+"""
+__version__ = "0.1.3"
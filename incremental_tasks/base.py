@@ -7,8 +7,14 @@ abstract method is `generate_single` that should generate a SingleTM object: a
   predicted.
 
 """
+import itertools
+import math
+import os
+import random
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
 from typing import (
+    TYPE_CHECKING,
     Any,
     Dict,
     Generator,
@@ -21,7 +27,8 @@ from typing import (
     Union,
 )
 
-import numpy as np
+if TYPE_CHECKING:
+    from ._rng import Seed
 
 TaskType = List[List[str]]
 Mask = Optional[List[List[int]]]
@@ -30,9 +37,13 @@ SingleTM = Tuple[List[str], Optional[List[int]]]
 
 
 def choose_minimal_set(tasks: TaskType, max_n_seq: int, mask: Mask = None) -> TaskMask:
-    """Select `max_n_seq` random task/mask pairs from a list."""
+    """Select `max_n_seq` random task/mask pairs from a list.
+
+    The selection is drawn with the standard `random` module, so it is seeded
+    with `random.seed` (`np.random.seed` has no effect on it).
+    """
     if len(tasks) > max_n_seq:
-        idx = np.random.choice(range(len(tasks)), size=max_n_seq, replace=False)
+        idx = random.sample(range(len(tasks)), max_n_seq)
         if mask is not None and len(mask) == len(tasks):
             return_mask = [mask[i] for i in idx]
         else:
@@ -43,9 +54,18 @@ def choose_minimal_set(tasks: TaskType, max_n_seq: int, mask: Mask = None) -> Ta
     return tasks, mask
 
 
+def make_symbol_to_idx(dictionary: Sequence[str]) -> Dict[str, int]:
+    """Maps every symbol of a dictionary to the index of its first occurrence."""
+    symbol_to_idx: Dict[str, int] = {}
+    for idx, symbol in enumerate(dictionary):
+        symbol_to_idx.setdefault(symbol, idx)
+    return symbol_to_idx
+
+
 def get_idx(task: List[str], dictionary: List[str]) -> List[int]:
     """Remaps the task symbols to dictionary indexes."""
-    return [dictionary.index(s) for s in task]
+    symbol_to_idx = make_symbol_to_idx(dictionary)
+    return [symbol_to_idx[s] for s in task]
 
 
 class Task(ABC):
@@ -61,7 +81,13 @@ class Task(ABC):
 
     def __init__(self, name: str):
         self.name = name
-        self.lengths: List[int] = []
+        self.lengths: Sequence[int] = []
+        self._symbol_to_idx: Dict[str, int] = {}
+        self._symbol_to_idx_src: Optional[List[str]] = None
+        self._symbol_to_idx_size = -1
+        self._sample_cache: Optional[TaskMask] = None
+        # Numpy generator of the tasks drawing their sequences with numpy
+        self._rng: Any = None
 
     @abstractmethod
     def generate_single(self, **kwargs) -> SingleTM:
@@ -73,22 +99,90 @@ class Task(ABC):
         unique sequence is generated)."""
         tasks = []
         masks: List[List[int]] = []
-        task_set: Set[str] = set()
+        # Sequences are deduplicated on the tuple of their tokens, which
+        # avoids joining every sequence into a string
+        task_set: Set[Tuple[str, ...]] = set()
+        # Bind the methods used in the loop once
+        generate_single = self.generate_single
+        add_task_key = task_set.add
+        max_count = 5 * max_n_seq
         count = 0
-        while len(task_set) < max_n_seq and count < 5 * max_n_seq:
-            task_list, mask = self.generate_single(**kwargs)
-            if hasattr(self, "separator_symbol"):
-                task_str = getattr(self, "separator_symbol").join(task_list)
-            else:
-                task_str = "".join(task_list)
-            if task_str not in task_set:
+        while len(task_set) < max_n_seq and count < max_count:
+            task_list, mask = generate_single(**kwargs)
+            task_key = tuple(task_list)
+            if task_key not in task_set:
                 if mask is not None:
                     masks.append(mask)
                 tasks.append(task_list)
-                task_set.add(task_str)
+                add_task_key(task_key)
             count += 1
         return choose_minimal_set(tasks, max_n_seq, mask=masks)
 
+    def generate_batch(self, n_seq: int, **kwargs) -> List[SingleTM]:
+        """Generates `n_seq` pairs of sequence/mask (not necessarily unique).
+        Sub-classes can override this to draw the random decisions of the whole
+        batch at once."""
+        return [self.generate_single(**kwargs) for _ in range(n_seq)]
+
+    def generate_parallel(
+        self,
+        n_seq: int,
+        n_workers: Optional[int] = None,
+        seed: Optional[int] = None,
+        **kwargs,
+    ) -> List[SingleTM]:
+        """Generates `n_seq` pairs of sequence/mask (not necessarily unique)
+        with `n_workers` processes (one per CPU by default). Each process
+        generates a chunk of the batch from its own random streams, spawned
+        from `seed`, so the output only depends on `seed` and `n_workers`."""
+        # Imported here so that numpy is only loaded by the tasks using it
+        from ._rng import spawn_seeds  # pylint: disable=import-outside-toplevel
+
+        n_workers = max(1, min(n_workers or os.cpu_count() or 1, n_seq))
+        sizes = [n_seq // n_workers + (i < n_seq % n_workers) for i in range(n_workers)]
+        with ProcessPoolExecutor(n_workers) as executor:
+            chunks = executor.map(
+                _generate_chunk,
+                itertools.repeat(self),
+                sizes,
+                spawn_seeds(n_workers, seed),
+                itertools.repeat(kwargs),
+            )
+            return [pair for chunk in chunks for pair in chunk]
+
+    def reseed(self, seed: "Seed"):
+        """Reseeds the random generators the task draws from: the `random`
+        module and the numpy generator of the tasks that have one (see
+        `incremental_tasks.seed` to seed the generators of new instances).
+        `seed` is an integer or a numpy `SeedSequence`, from which the seed of
+        the `random` module is then derived."""
+        # The numpy helpers are imported here so that numpy is only loaded by
+        # the tasks using it
+        # pylint: disable=import-outside-toplevel
+        if isinstance(seed, int):
+            random.seed(seed)
+        else:
+            from ._rng import random_seed
+
+            random.seed(random_seed(seed))
+        if self._rng is not None:
+            from ._rng import new_rng
+
+            self._rng = new_rng(seed)
+
+    def generate_single_into(
+        self, task_buf: List[str], mask_buf: List[int], **kwargs
+    ) -> None:
+        """Appends a single sequence and its mask to the caller-provided
+        `task_buf` and `mask_buf`, with mask indices referring to positions in
+        `task_buf`. This is a convenience wrapper around `generate_single`;
+        only `ElementaryLanguage` fills the buffers directly."""
+        offset = len(task_buf)
+        task, mask = self.generate_single(**kwargs)
+        task_buf.extend(task)
+        if mask is not None:
+            mask_buf.extend(offset + i for i in mask)
+
     def generate_tasks_generator(
         self, max_n_seq: Optional[int] = 10, **kwargs
     ) -> Generator[SingleTM, None, None]:
@@ -101,13 +195,25 @@ class Task(ABC):
             yield self.generate_single(**kwargs)
             count += 1
 
+    def _get_sample(self) -> TaskMask:
+        """Returns a sample of 500 sequences used to estimate statistics about
+        the task. The sample is generated once and shared between calls."""
+        if self._sample_cache is None:
+            self._sample_cache = self.generate_tasks(max_n_seq=500)
+        return self._sample_cache
+
+    def clear_sample_cache(self):
+        """Discards the sample of sequences used by `get_true_output_size` and
+        `get_n_items_per_seq` so that the next call draws a new one."""
+        self._sample_cache = None
+
     def get_true_output_size(self) -> int:
         """This method computes the "true" output dictionary size for the given
         task from generated sequences.
 
         """
         output_space: Set[str] = set()
-        sample_tasks, sample_masks = self.generate_tasks(max_n_seq=500)
+        sample_tasks, sample_masks = self._get_sample()
         if sample_masks is not None:
             for i, task in enumerate(sample_tasks):
                 output_space.update(task[k] for k in sample_masks[i])
@@ -116,11 +222,30 @@ class Task(ABC):
     def get_n_items_per_seq(self) -> float:
         """This method computes an average number of symbol per sequence (out of
         500 sequences)."""
-        _, sample_masks = self.generate_tasks(max_n_seq=500)
+        _, sample_masks = self._get_sample()
         if sample_masks is not None:
-            return float(np.mean([len(i) for i in sample_masks]))
+            return sum(len(i) for i in sample_masks) / len(sample_masks)
         raise ValueError("Cannot estimate number of items per sequence without masking")
 
+    @property
+    def symbol_to_idx(self) -> Dict[str, int]:
+        """The mapping from symbols to their index in the task's dictionary. It
+        is only rebuilt when the dictionary is reassigned or its size changes."""
+        if (
+            self._symbol_to_idx_src is not self.dictionary
+            or self._symbol_to_idx_size != len(self.dictionary)
+        ):
+            self._symbol_to_idx = make_symbol_to_idx(self.dictionary)
+            self._symbol_to_idx_src = self.dictionary
+            self._symbol_to_idx_size = len(self.dictionary)
+        return self._symbol_to_idx
+
+    def encode(self, task: List[str]) -> List[int]:
+        """Remaps the symbols of a sequence to indexes in the task's
+        dictionary."""
+        symbol_to_idx = self.symbol_to_idx
+        return [symbol_to_idx[s] for s in task]
+
     def output_dimension(self) -> int:
         """Returns the output dimension for the task (same as the dictionary
         size)."""
@@ -128,16 +253,18 @@ class Task(ABC):
 
     def set_lengths(self, lengths: Union[int, List[int]]):
         """This is an internal function used to compute the lengths of sequences
-        when applicable."""
+        when applicable. Ranges of lengths are stored as `range` objects rather
+        than materialized lists."""
+        self.clear_sample_cache()
         if isinstance(lengths, int) or len(lengths) == 1:
             if not isinstance(lengths, int):
                 length = lengths[0]
             else:
                 length = lengths
-            self.lengths = list(range(1, length + 1))
+            self.lengths = range(1, length + 1)
         elif len(lengths) == 2:
             if lengths[1] > lengths[0]:
-                self.lengths = list(range(lengths[0], lengths[1]))
+                self.lengths = range(lengths[0], lengths[1])
             else:
                 raise ValueError("Wrong lengths")
         else:
@@ -158,6 +285,7 @@ class HybridTask(Task):
         # create a new HybridTask
         for name in named_tasks:
             self.named_tasks[name] = named_tasks[name](*task_args.get(name, []))
+        self._names_tuple = tuple(self.named_tasks)
         super().__init__(f"hyb_{'_'.join(t.name for t in self.named_tasks.values())}")
 
         # The dictionary is the union of all subtask dictionaries
@@ -166,8 +294,19 @@ class HybridTask(Task):
             set_dictionary.update(task.dictionary)
         self.dictionary = list(set_dictionary)
 
+    def reseed(self, seed: "Seed"):
+        for offset, task in enumerate(self.named_tasks.values(), 1):
+            if isinstance(seed, int):
+                task.reseed(seed + offset)
+            else:
+                # pylint: disable-next=import-outside-toplevel
+                from ._rng import child_seed
+
+                task.reseed(child_seed(seed, offset))
+        super().reseed(seed)
+
     def generate_single(self, **kwargs) -> SingleTM:
-        chosen_task = np.random.choice(list(self.named_tasks.keys()))
+        chosen_task = random.choice(self._names_tuple)
         return self.named_tasks[chosen_task].generate_single(**kwargs)
 
 
@@ -206,29 +345,42 @@ class BinarizedTask(Task):
         self.base_task = base_task
         self.dictionary = ["0", "1"]
 
-        self.enc_size = int(np.ceil(np.log2(len(self.base_task.dictionary))))
+        self.enc_size = math.ceil(math.log2(len(self.base_task.dictionary)))
         formatter = f"{{:0{self.enc_size}b}}"
         self.mapping = {
             d: formatter.format(n) for n, d in enumerate(self.base_task.dictionary)
         }
+        self._mask_offsets = range(self.enc_size)
 
     def convert_to_binary(self, task: List[str], mask: Optional[List[int]]) -> SingleTM:
         """This converts a sequence with multiple symbols to a binary one."""
-        task = [c for g in task for c in self.mapping[g]]
+        # Joining the binary strings and splitting the result into characters
+        # keeps the whole expansion in C
+        task = list("".join(map(self.mapping.__getitem__, task)))
         if mask is not None:
-            ret_mask = [
-                self.enc_size * c + i for i in range(self.enc_size) for c in mask
-            ]
+            scaled_mask = [self.enc_size * c for c in mask]
+            ret_mask = [c + i for i in self._mask_offsets for c in scaled_mask]
 
         else:
             ret_mask = None
         return task, ret_mask
 
+    def reseed(self, seed: "Seed"):
+        self.base_task.reseed(seed)
+
     def generate_single(self, **kwargs) -> SingleTM:
         task, mask = self.base_task.generate_single(**kwargs)
         return self.convert_to_binary(task, mask)
 
 
+def _generate_chunk(
+    task: Task, n_seq: int, seed: "Seed", kwargs: Dict[str, Any]
+) -> List[SingleTM]:
+    """Generates a chunk of `Task.generate_parallel` in a worker process."""
+    task.reseed(seed)
+    return task.generate_batch(n_seq, **kwargs)
+
+
 def print_with_sep(tasks, sep="", lim=10):
     """Pretty print some examples from a task's generated sequences."""
     print("\n".join([sep.join([str(k) for k in s]) for s in tasks[:lim]]))
@@ -9,11 +9,11 @@ import sys
 from argparse import ArgumentParser
 from typing import Callable, List, Sequence, Tuple, Union
 
-import numpy as np
-
-from incremental_tasks import ID_TO_TASK, NAME_TO_ID, Task
+from incremental_tasks import ID_TO_PRETTY_NAME, NAME_TO_ID, get_task_class
 from incremental_tasks._version import __version__
-from incremental_tasks.base import get_idx
+from incremental_tasks.base import Task
+
+_MAX_TASK_ID = max(ID_TO_PRETTY_NAME)
 
 
 def make_parser() -> ArgumentParser:
@@ -46,10 +46,10 @@ def make_parser() -> ArgumentParser:
     )
     parser.add_argument(
         "--extra-args",
-        type=List[str],
+        type=str,
         nargs="*",
-        help="Optional additional arguments to be passed to the task instance "
-        "(see documentation for details).",
+        help="Optional additional arguments to be passed to the task instance, "
+        "given as space separated strings (see documentation for details).",
     )
     parser.add_argument(
         "--human-eval",
@@ -84,7 +84,7 @@ def get_task(task_id: Union[str, int]) -> Task:
         task_id_int = int(task_id)
     else:
         task_id_int = NAME_TO_ID[task_id]
-    return ID_TO_TASK[task_id_int]()
+    return get_task_class(task_id_int)()
 
 
 def check_answer(
@@ -92,11 +92,12 @@ def check_answer(
 ) -> Tuple[List[str], bool]:
     """Check a user provided answer against the true output."""
 
+    mask_set = set(mask)
     as_task_list = []
     count = 0
     good = True
     for idx, symbol in enumerate(task_list):
-        if idx not in mask:
+        if idx not in mask_set:
             as_task_list.append(symbol)
         else:
             base = f"\033[1m{symbol}\033[0m\033[0m"
@@ -109,6 +110,15 @@ def check_answer(
     return as_task_list, good
 
 
+def hide_answers(task_list: List[str], mask: List[int]) -> List[str]:
+    """Replaces the symbols to predict with a placeholder."""
+    mask_set = set(mask)
+    return [
+        s if n not in mask_set else "\033[94m\033[1m{?}\033[0m\033[0m"
+        for n, s in enumerate(task_list)
+    ]
+
+
 def interactive_session(
     task_id: int, gen_fn: Callable[[], Tuple[Sequence[str], Union[List[int], None]]]
 ):
@@ -123,7 +133,7 @@ def interactive_session(
         current_id = 1
     else:
         current_id = task_id
-    while current_id < max(ID_TO_TASK.keys()):
+    while current_id < _MAX_TASK_ID:
         correct_in_a_row = 0
         n_tries = 0
         wade = {}
@@ -137,12 +147,8 @@ def interactive_session(
                 mask = mask[:6]
                 task_list = task_list[:stop_idx]
 
-            qs_task_list = [
-                s if n not in mask else "\033[94m\033[1m{?}\033[0m\033[0m"
-                for n, s in enumerate(task_list)
-            ]
             sys.stdout.write(70 * "=" + "\n")
-            sys.stdout.write(" ".join(qs_task_list) + "\n")
+            sys.stdout.write(" ".join(hide_answers(task_list, mask)) + "\n")
 
             answer = input("Type you answers (space separated) ").split(" ")
             as_task_list, good = check_answer(answer, task_list, mask)
@@ -167,26 +173,54 @@ def interactive_session(
     print("Congrats you finished the game!")
 
 
+def write_examples(
+    gen_fn: Callable[[], Tuple[Sequence[str], Union[List[int], None]]],
+    n_examples: int,
+    show_mask: bool = True,
+    chunk_size: int = 1024,
+):
+    """Writes `n_examples` sentences from `gen_fn` to stdout, each optionally
+    followed by its mask. Lines are written by chunks of `chunk_size` to limit
+    the number of writes.
+
+    """
+    lines: List[str] = []
+    for _ in range(n_examples):
+        task_list, mask = gen_fn()
+        lines.append(" ".join(task_list))
+        if mask is not None and show_mask:
+            lines.append(" ".join(map(str, mask)))
+        if len(lines) >= chunk_size:
+            sys.stdout.write("\n".join(lines) + "\n")
+            lines.clear()
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
 def main():
     """Main entrypoint for the CLI tool."""
     argparser = make_parser()
     args = argparser.parse_args()
     if hasattr(args, "seed"):
-        random.seed(args.seed)
-        np.random.seed(args.seed)
+        # Imported here so that numpy is not loaded by `--help` or `--version`
+        # pylint: disable-next=import-outside-toplevel
+        from incremental_tasks._rng import seed
+
+        seed(args.seed)
 
     if args.task_id is None:
-        task = get_task(random.randint(1, len(ID_TO_TASK)))
+        task = get_task(random.randint(1, len(ID_TO_PRETTY_NAME)))
     else:
         task = get_task(args.task_id)
 
     if args.human_eval:
         symbol_map = list(string.ascii_lowercase + string.ascii_uppercase)
         random.shuffle(symbol_map)
+        remap = {sym: symbol_map[idx] for sym, idx in task.symbol_to_idx.items()}
 
         def gen_human_eval():
             t_list, msk = task.generate_single()
-            return [symbol_map[x] for x in get_idx(t_list, task.dictionary)], msk
+            return [remap[x] for x in t_list], msk
 
         gen_fn = gen_human_eval
     else:
@@ -200,8 +234,4 @@ def main():
     if args.interactive:
         interactive_session(args.task_id, gen_fn)
 
-    for _ in range(args.n_examples):
-        task_list, mask = gen_fn()
-        sys.stdout.write(" ".join(task_list) + "\n")
-        if mask is not None and not args.no_mask:
-            sys.stdout.write(" ".join(map(str, mask)) + "\n")
+    write_examples(gen_fn, args.n_examples, show_mask=not args.no_mask)
@@ -1,55 +1,68 @@
 """Implementation of the language based tasks."""
+import random
+import sys
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
-
-import numpy as np
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 
+from ._rng import new_rng
 from .base import SingleTM, TokenTask
 
 
+def intern_tokens(tokens: List[str]) -> List[str]:
+    """Interns tokens so that the generated sentences and the dictionary share
+    the same string objects. Literals are already interned by Python, but tokens
+    read from a file or built at runtime are not."""
+    return [sys.intern(str(token)) for token in tokens]
+
+
 def add_no(verb: str, no_names: Optional[List[str]] = None) -> List[str]:
     """Helper function for the QA tasks. Add NOs affirmation"""
     if no_names is not None and no_names:
-        return ["I", "DO", "NOT", verb] + no_names
+        return ["I", "DO", "NOT", verb, *no_names]
     return []
 
 
 def add_yes(verb, yes_names: Optional[List[str]] = None) -> List[str]:
     """Helper function for the QA tasks. Adds YESs affirmations"""
     if yes_names is not None and yes_names:
-        return ["I", verb] + yes_names
+        return ["I", verb, *yes_names]
     return []
 
 
+def interleave(tokens: List[str], link_word: str = "AND") -> List[str]:
+    """Helper function for the QA tasks. Inserts a link word between
+    consecutive tokens."""
+    output = [link_word] * (2 * len(tokens) - 1)
+    output[::2] = tokens
+    return output
+
+
+LINK_WORDS = ("AND", "BUT")
+
+
+def link_sentences(first: List[str], second: List[str], link_word: str) -> List[str]:
+    """Helper function for the QA tasks. Joins two affirmations with a link word
+    if both are non-empty."""
+    if first and second:
+        return [*first, link_word, *second]
+    return first + second
+
+
 def make_sentence(
     verb: str,
     yes_names: Optional[List[str]] = None,
     no_names: Optional[List[str]] = None,
-    link_words: Optional[List[str]] = None,
+    link_words: Optional[Sequence[str]] = None,
 ) -> List[str]:
     """Creates a list of sentences of the form YES/NO affirmation linked with
     link words.
     """
     if link_words is None:
-        link_words = ["AND", "BUT"]
-    base = []
-    if np.random.random() < 0.5:
-        base += add_no(verb, no_names)
-        add = add_yes(verb, yes_names)
-        if base and add:
-            base += [np.random.choice(link_words)]
-            base += add
-        elif add:
-            base += add
-    else:
-        base += add_yes(verb, yes_names)
-        add = add_no(verb, no_names)
-        if base and add:
-            base += [np.random.choice(link_words)]
-            base += add
-        elif add:
-            base += add
-    return base
+        link_words = LINK_WORDS
+    first, second = add_no(verb, no_names), add_yes(verb, yes_names)
+    if random.random() >= 0.5:
+        first, second = second, first
+    return link_sentences(first, second, random.choice(link_words))
 
 
 @dataclass
@@ -62,6 +75,7 @@ class ElementaryLanguageSymbols:
     query_symbol: str = "?"
 
 
+# pylint: disable-next=too-many-instance-attributes
 class ElementaryLanguage(TokenTask):
     """An elementary language task of the form
     ```
@@ -69,64 +83,164 @@ class ElementaryLanguage(TokenTask):
     ```
     """
 
+    # Words of the dictionary that do not depend on the task parameters
+    _static_words: Tuple[str, ...] = ("I", "DO", "NOT", "AND", "BUT")
+
     def __init__(
         self,
         object_names: Optional[List[str]] = None,
         verbs: Optional[List[str]] = None,
         symbols: ElementaryLanguageSymbols = ElementaryLanguageSymbols(),
     ):
-        self.object_names = (
+        self.object_names = intern_tokens(
             object_names
             if object_names is not None
             else ["PETER", "JOHN", "TOM", "JAMES", "PAUL"]
         )
-        self.verbs = verbs if verbs is not None else ["SEE", "HEAR"]
+        self.verbs = intern_tokens(verbs if verbs is not None else ["SEE", "HEAR"])
         self.sentence_term_symbol = symbols.sentence_term_symbol
         self.query_symbol = symbols.query_symbol
         self.separator_symbol = symbols.separator_symbol
-        dictionary = self.object_names + self.verbs  # + color_adj
-        dictionary += [
-            "I",
-            "DO",
-            "NOT",
-            "AND",
-            "BUT",
+        dictionary = [
+            *self.object_names,
+            *self.verbs,
+            *self._static_words,
             symbols.query_symbol,
             symbols.sentence_term_symbol,
             "YES",
             "NO",
         ]
         super().__init__("qa", 0, dictionary)
+        # Sizes used to draw random subsets for every sequence
+        self._n_names = len(self.object_names)
+        self._n_verbs = len(self.verbs)
+        self._rng = new_rng()
+
+    def generate_batch(self, n_seq: int, **kwargs) -> List[SingleTM]:
+        """Generates `n_seq` pairs of sequence/mask. All the random decisions of
+        the batch are drawn at once with numpy before the sentences are
+        assembled."""
+        if type(self).generate_single is not ElementaryLanguage.generate_single:
+            # Sub-classes generating other kinds of sentences
+            return super().generate_batch(n_seq, **kwargs)
+
+        gen = self._rng
+        verb_idx = gen.integers(self._n_verbs, size=n_seq)
+        subset_sizes = gen.integers(1, self._n_names, size=n_seq)
+        # The first elements of a random permutation of the names are a random
+        # subset in random order, so the first `n_yes` of them are the yes names
+        # and the rest of the subset the no names
+        perms = gen.random((n_seq, self._n_names)).argsort(axis=1)
+        n_yes = gen.integers(0, subset_sizes + 1)
+        tgt_pos = gen.integers(0, subset_sizes)
+        no_first = gen.random(n_seq) < 0.5
+        link_idx = gen.integers(2, size=n_seq)
+
+        decisions = zip(
+            verb_idx.tolist(),
+            subset_sizes.tolist(),
+            perms.tolist(),
+            n_yes.tolist(),
+            tgt_pos.tolist(),
+            no_first.tolist(),
+            link_idx.tolist(),
+        )
+        return [self._make_task(decision) for decision in decisions]
+
+    def _make_task(
+        self, decision: Tuple[int, int, List[int], int, int, bool, int]
+    ) -> SingleTM:
+        """Assembles a sentence from the random decisions drawn by
+        `generate_batch`."""
+        verb_idx, subset_size, perm, n_yes, tgt_pos, no_first, link_idx = decision
+        verb = self.verbs[verb_idx]
+        subset = [self.object_names[i] for i in perm[:subset_size]]
+        yes_part = add_yes(verb, interleave(subset[:n_yes]))
+        no_part = add_no(verb, interleave(subset[n_yes:]))
+        if no_first:
+            task = link_sentences(no_part, yes_part, LINK_WORDS[link_idx])
+        else:
+            task = link_sentences(yes_part, no_part, LINK_WORDS[link_idx])
+        task += [
+            self.sentence_term_symbol,
+            "DO",
+            "I",
+            verb,
+            subset[tgt_pos],
+            self.query_symbol,
+            "YES" if tgt_pos < n_yes else "NO",
+        ]
+        return task, [len(task) - 1]
 
     def generate_single(self, **kwargs) -> SingleTM:
         del kwargs
-        current_mask = []
-        verb = np.random.choice(self.verbs)
+        task: List[str] = []
+        current_mask: List[int] = []
+        self._fill(task, current_mask)
+        return task, current_mask
+
+    def generate_single_into(
+        self, task_buf: List[str], mask_buf: List[int], **kwargs
+    ) -> None:
+        if type(self).generate_single is not ElementaryLanguage.generate_single:
+            # Sub-classes generating other kinds of sentences
+            super().generate_single_into(task_buf, mask_buf, **kwargs)
+        else:
+            self._fill(task_buf, mask_buf)
+
+    def _fill(self, task_buf: List[str], mask_buf: List[int]):
+        """Appends a sequence and its mask to `task_buf` and `mask_buf`."""
+        verb = random.choice(self.verbs)
 
         # Choose a subset of object names to work with
-        subset_size = np.random.randint(1, len(self.object_names))
-        subset = np.random.choice(self.object_names, size=subset_size, replace=False)
+        subset_size = random.randrange(1, self._n_names)
+        if subset_size == 1:
+            self._fill_single_name(verb, task_buf, mask_buf)
+            return
+        subset = random.sample(self.object_names, subset_size)
 
         # Decide the yes names and the no names (may be empty)
-        yes = np.random.randint(len(subset) + 1)
-        yes_names = np.random.choice(subset, size=yes, replace=False).tolist()
+        yes = random.randrange(len(subset) + 1)
+        yes_names = random.sample(subset, yes)
+        yes_set = set(yes_names)
         if yes_names:
-            yes_names = " AND ".join(yes_names).split(" ")
-        no_names = [i for i in subset if i not in yes_names]
+            yes_names = interleave(yes_names)
+        no_names = [i for i in subset if i not in yes_set]
         if no_names:
-            no_names = " AND ".join(no_names).split(" ")
+            no_names = interleave(no_names)
 
         # Build the sentence
-        task = make_sentence(verb, yes_names, no_names)
-        tgt = np.random.choice(subset)
+        task_buf.extend(make_sentence(verb, yes_names, no_names))
+        tgt = random.choice(subset)
         # Make the answer
-        task += (
-            [self.sentence_term_symbol]
-            + ["DO", "I", verb, tgt, self.query_symbol]
-            + ["YES" if tgt in yes_names else "NO"]
+        task_buf.extend(
+            (
+                self.sentence_term_symbol,
+                "DO",
+                "I",
+                verb,
+                tgt,
+                self.query_symbol,
+                "YES" if tgt in yes_set else "NO",
+            )
         )
-        current_mask.append(len(task) - 1)
-        return task, current_mask
+        mask_buf.append(len(task_buf) - 1)
+
+    def _fill_single_name(self, verb: str, task_buf: List[str], mask_buf: List[int]):
+        """Fast path of `_fill` for a subset of a single name, which is either
+        the only yes name or the only no name."""
+        name = random.choice(self.object_names)
+        if random.random() < 0.5:
+            task_buf.extend(("I", verb, name))
+            answer = "YES"
+        else:
+            task_buf.extend(("I", "DO", "NOT", verb, name))
+            answer = "NO"
+        task_buf.extend(
+            (self.sentence_term_symbol, "DO", "I", verb, name, self.query_symbol)
+        )
+        task_buf.append(answer)
+        mask_buf.append(len(task_buf) - 1)
 
 
 class HarderElementaryLanguage(ElementaryLanguage):
@@ -204,45 +318,46 @@ class ElementaryLanguageWithWorldDef(ElementaryLanguage):
         self.name = "qa-world-def"
 
     def make_task_mask_from_name_map(
-        self, verbs: np.ndarray, name_map: Dict[str, List[str]]
+        self, verbs: List[str], name_map: Dict[str, List[str]]
     ) -> SingleTM:
         """This is an intermediary function that will create a task, mask pair
         from the verbs and name_map of the task."""
         current_mask = []
         task = []
         yes_map: Dict[str, List[str]] = {}
-        no_map: Dict[str, List[str]] = {}
         first = True
         for verb in verbs:
             if not first:
-                task += [self.sentence_term_symbol]
+                task.append(self.sentence_term_symbol)
             else:
                 first = False
             # Decide the yes names and the no names (may be empty)
-            yes = np.random.randint(len(name_map[verb]) + 1)
-            yes_names = np.random.choice(
-                name_map[verb], size=yes, replace=False
-            ).tolist()
+            yes = random.randrange(len(name_map[verb]) + 1)
+            yes_names = random.sample(name_map[verb], yes)
             yes_map[verb] = yes_names
+            yes_set = set(yes_names)
             if yes_names:
-                yes_names = " AND ".join(yes_names).split(" ")
-            no_names = [i for i in name_map[verb] if i not in yes_names]
-            no_map[verb] = no_names
+                yes_names = interleave(yes_names)
+            no_names = [i for i in name_map[verb] if i not in yes_set]
             if no_names:
-                no_names = " AND ".join(no_names).split(" ")
+                no_names = interleave(no_names)
 
             # Build the sentence
             task += make_sentence(verb, yes_names, no_names)
 
         # Choose which verb/name we will ask about
-        question_verb = str(np.random.choice(verbs))
-        tgt = np.random.choice(name_map[question_verb])
+        question_verb = random.choice(verbs)
+        tgt = random.choice(name_map[question_verb])
         # Make the answer
-        task += (
-            [self.sentence_term_symbol]
-            + ["DO", "I", question_verb, tgt, self.query_symbol]
-            + ["YES" if tgt in yes_map[question_verb] else "NO"]
-        )
+        task += [
+            self.sentence_term_symbol,
+            "DO",
+            "I",
+            question_verb,
+            tgt,
+            self.query_symbol,
+            "YES" if tgt in yes_map[question_verb] else "NO",
+        ]
         current_mask.append(len(task) - 1)
         return task, current_mask
 
@@ -250,19 +365,18 @@ class ElementaryLanguageWithWorldDef(ElementaryLanguage):
         del kwargs
 
         # Choose a subset of object names to work with
-        subset_size = np.random.randint(1, len(self.object_names))
-        subset = np.random.choice(self.object_names, size=subset_size, replace=False)
+        subset_size = random.randrange(1, self._n_names)
+        subset = random.sample(self.object_names, subset_size)
 
         # Choose the number of verbs to use
-        n_verbs = np.random.randint(1, min(len(self.verbs), subset_size) + 1)
-        verbs = np.random.choice(self.verbs, size=n_verbs, replace=False)
+        n_verbs = random.randrange(1, min(self._n_verbs, subset_size) + 1)
+        verbs = random.sample(self.verbs, n_verbs)
 
         name_map: Dict[str, List[str]] = {}
-        indices = np.random.choice(range(len(subset)), size=n_verbs, replace=False)
-        indices = np.sort(indices)
+        indices = sorted(random.sample(range(len(subset)), n_verbs))
         for i, verb in enumerate(verbs):
             right = len(subset) if i >= len(verbs) - 1 else indices[i + 1]
-            name_map[verb] = subset[indices[i] : right].tolist()
+            name_map[verb] = subset[indices[i] : right]
 
         return self.make_task_mask_from_name_map(verbs, name_map)
 
@@ -324,14 +438,13 @@ class ElementaryLanguageWithWorldDefCounting(ElementaryLanguageWithWorldDef):
             ],
         )
 
-        numbers = NUMBERS if numbers is None else numbers
+        numbers = NUMBERS if numbers is None else intern_tokens(numbers)
         self.name = "qa-world-def-ct"
         self.number_map = dict(enumerate(numbers))
-        self.dictionary += numbers
-        self.dictionary += ["HOW", "MANY", "PEOPLE"]
+        self.dictionary += [*numbers, "HOW", "MANY", "PEOPLE"]
 
     def make_task_mask_from_name_map(
-        self, verbs: np.ndarray, name_map: Dict[str, List[str]]
+        self, verbs: List[str], name_map: Dict[str, List[str]]
     ) -> SingleTM:
         """This is an intermediary function that will create a task, mask pair
         from the verbs and name_map of the task."""
@@ -339,58 +452,57 @@ class ElementaryLanguageWithWorldDefCounting(ElementaryLanguageWithWorldDef):
         current_mask = []
         task = []
         yes_map: Dict[str, List[str]] = {}
-        no_map: Dict[str, List[str]] = {}
         first = True
         for verb in verbs:
             if not first:
-                task += [self.sentence_term_symbol]
+                task.append(self.sentence_term_symbol)
             else:
                 first = False
             # Decide the yes names and the no names (may be empty)
-            yes = np.random.randint(len(name_map[verb]) + 1)
-            yes_names = np.random.choice(
-                name_map[verb], size=yes, replace=False
-            ).tolist()
+            yes = random.randrange(len(name_map[verb]) + 1)
+            yes_names = random.sample(name_map[verb], yes)
             yes_map[verb] = yes_names
+            yes_set = set(yes_names)
             if yes_names:
-                yes_names = " AND ".join(yes_names).split(" ")
-            no_names = [i for i in name_map[verb] if i not in yes_names]
-            no_map[verb] = no_names
+                yes_names = interleave(yes_names)
+            no_names = [i for i in name_map[verb] if i not in yes_set]
             if no_names:
-                no_names = " AND ".join(no_names).split(" ")
+                no_names = interleave(no_names)
 
             # Build the sentence
             task += make_sentence(verb, yes_names, no_names)
 
-        coin_up = np.random.random() > 0.5
+        coin_up = random.random() > 0.5
         if coin_up:
             # Choose which verb we will ask about
-            question_verb = str(np.random.choice(verbs))
+            question_verb = random.choice(verbs)
             # Make the answer
-            task += (
-                [self.sentence_term_symbol]
-                + [
-                    "HOW",
-                    "MANY",
-                    "PEOPLE",
-                    "DO",
-                    "I",
-                    question_verb,
-                    self.query_symbol,
-                ]
-                + [self.number_map[len(yes_map[question_verb])]]
-            )
+            task += [
+                self.sentence_term_symbol,
+                "HOW",
+                "MANY",
+                "PEOPLE",
+                "DO",
+                "I",
+                question_verb,
+                self.query_symbol,
+                self.number_map[len(yes_map[question_verb])],
+            ]
 
         else:
             # Choose which verb/name we will ask about
-            question_verb = str(np.random.choice(verbs))
-            tgt = np.random.choice(name_map[question_verb])
+            question_verb = random.choice(verbs)
+            tgt = random.choice(name_map[question_verb])
             # Make the answer
-            task += (
-                [self.sentence_term_symbol]
-                + ["DO", "I", question_verb, tgt, self.query_symbol]
-                + ["YES" if tgt in yes_map[question_verb] else "NO"]
-            )
+            task += [
+                self.sentence_term_symbol,
+                "DO",
+                "I",
+                question_verb,
+                tgt,
+                self.query_symbol,
+                "YES" if tgt in yes_map[question_verb] else "NO",
+            ]
         current_mask.append(len(task) - 1)
         return task, current_mask
 
@@ -398,23 +510,30 @@ class ElementaryLanguageWithWorldDefCounting(ElementaryLanguageWithWorldDef):
         del kwargs
 
         # Choose a subset of object names to work with
-        subset_size = np.random.randint(1, len(self.object_names))
-        subset = np.random.choice(self.object_names, size=subset_size, replace=False)
+        subset_size = random.randrange(1, self._n_names)
+        subset = random.sample(self.object_names, subset_size)
 
         # Choose the number of verbs to use
-        n_verbs = np.random.randint(1, min(len(self.verbs), subset_size) + 1)
-        verbs = np.random.choice(self.verbs, size=n_verbs, replace=False)
+        n_verbs = random.randrange(1, min(self._n_verbs, subset_size) + 1)
+        verbs = random.sample(self.verbs, n_verbs)
 
         name_map: Dict[str, List[str]] = {}
-        indices = np.random.choice(range(len(subset)), size=n_verbs, replace=False)
-        indices = np.sort(indices)
+        indices = sorted(random.sample(range(len(subset)), n_verbs))
         for i, verb in enumerate(verbs):
             right = len(subset) if i >= len(verbs) - 1 else indices[i + 1]
-            name_map[verb] = subset[indices[i] : right].tolist()
+            name_map[verb] = subset[indices[i] : right]
 
         return self.make_task_mask_from_name_map(verbs, name_map)
 
 
+def adjective_candidates(
+    yes_map: Dict[str, List[List[str]]]
+) -> List[Tuple[str, List[str]]]:
+    """Helper function for the adjective QA tasks. Lists the (verb, object)
+    pairs of `yes_map` whose object has at least one adjective."""
+    return [(k, i) for k, c in yes_map.items() for i in c if len(i) > 1]
+
+
 def make_adj_objs(
     size_adj: List[str], color_adj: List[str], obj_names: List[str]
 ) -> List[List[str]]:
@@ -424,19 +543,22 @@ def make_adj_objs(
     Returns:
         A list of lists of objects randomly prefixed.
     """
-    output = [[i] for i in np.random.permutation(obj_names)]
+    output = [[i] for i in random.sample(obj_names, len(obj_names))]
     for item in output:
-        if np.random.random() > 0.4:
-            item.insert(0, np.random.choice(color_adj))
-        if np.random.random() > 0.4:
-            item.insert(0, np.random.choice(size_adj))
+        if random.random() > 0.4:
+            item.insert(0, random.choice(color_adj))
+        if random.random() > 0.4:
+            item.insert(0, random.choice(size_adj))
     return output
 
 
+VOWELS = frozenset("AIUEO")
+
+
 def make_prefix(name):
     """This selects the correct english prefix depending on the beginning of the
     next name."""
-    if name[0] in ["A", "I", "U", "E", "O"]:
+    if name[0] in VOWELS:
         return "AN"
     return "A"
 
@@ -453,18 +575,41 @@ DEFAULT_OBJECT_NAMES = [
 ]
 
 
-def flatten_and_merge(pre_names: List[List[str]], separator_symbol: str) -> List[str]:
-    """This creates a joined and prefixed list of names."""
-    flatten_names = [
-        make_prefix(prefixed_name[0]) + separator_symbol + " ".join(prefixed_name)
-        for prefixed_name in pre_names
-    ]
-    return " AND ".join(flatten_names).split(" ")
+def flatten_and_merge(
+    pre_names: List[List[str]], separator_symbol: Optional[str] = None
+) -> List[str]:
+    """This creates a joined and prefixed list of names. `separator_symbol` is
+    ignored and only kept for compatibility."""
+    del separator_symbol
+    output: List[str] = []
+    for i, prefixed_name in enumerate(pre_names):
+        if i:
+            output.append("AND")
+        output.append(make_prefix(prefixed_name[0]))
+        output.extend(prefixed_name)
+    return output
 
 
+# pylint: disable-next=too-many-instance-attributes
 class AdjectiveLanguage(TokenTask):
     """A task with question about adjectives of objects."""
 
+    # Words of the dictionary that do not depend on the task parameters
+    _static_words: Tuple[str, ...] = (
+        "I",
+        "DO",
+        "NOT",
+        "AND",
+        "BUT",
+        "WHAT",
+        "A",
+        "AN",
+        "COLOR",
+        "SIZE",
+        "IS",
+        "THE",
+    )
+
     def __init__(
         self,
         object_names: Optional[List[str]] = None,
@@ -472,14 +617,18 @@ class AdjectiveLanguage(TokenTask):
         adj: Optional[Tuple[List[str], List[str]]] = None,
         symbols: ElementaryLanguageSymbols = ElementaryLanguageSymbols(),
     ):
-        self.object_names = (
+        self.object_names = intern_tokens(
             object_names if object_names is not None else DEFAULT_OBJECT_NAMES
         )
         self.color_adj, self.size_adj = (
-            adj[0] if adj is not None else ["RED", "GREEN", "BLUE", "YELLOW"],
-            adj[1] if adj is not None else ["SMALL", "BIG", "HUGE", "TINY"],
+            intern_tokens(adj[0])
+            if adj is not None
+            else ["RED", "GREEN", "BLUE", "YELLOW"],
+            intern_tokens(adj[1])
+            if adj is not None
+            else ["SMALL", "BIG", "HUGE", "TINY"],
         )
-        self.verbs = (
+        self.verbs = intern_tokens(
             verbs
             if verbs is not None
             else ["SEE", "HEAR", "CALL", "FEEL", "SMELL", "TOUCH"]
@@ -487,11 +636,25 @@ class AdjectiveLanguage(TokenTask):
         self.sentence_term_symbol = symbols.sentence_term_symbol
         self.query_symbol = symbols.query_symbol
         self.separator_symbol = symbols.separator_symbol
-        dictionary = self.object_names + self.verbs + self.color_adj + self.size_adj
-        dictionary += ["I", "DO", "NOT", "AND", "BUT", "WHAT", "A", "AN"]
-        dictionary += ["COLOR", "SIZE", "IS", "THE"]
-        dictionary += [symbols.query_symbol, symbols.sentence_term_symbol, "YES", "NO"]
+        dictionary = [
+            *self.object_names,
+            *self.verbs,
+            *self.color_adj,
+            *self.size_adj,
+            *self._static_words,
+            symbols.query_symbol,
+            symbols.sentence_term_symbol,
+            "YES",
+            "NO",
+        ]
         super().__init__("adj-qa", 0, dictionary)
+        # Sizes used to draw random subsets for every sequence
+        self._n_names = len(self.object_names)
+        self._n_verbs = len(self.verbs)
+        # Probability of asking a YES/NO question rather than an adjective one
+        self._p_yesno = 1 / (len(self.color_adj) + len(self.size_adj) + 2)
+        self._color_set = frozenset(self.color_adj)
+        self._size_set = frozenset(self.size_adj)
 
     def make_task_mask_from_name_map(
         self, verbs: List[str], name_map: Dict[str, List[List[str]]]
@@ -502,38 +665,32 @@ class AdjectiveLanguage(TokenTask):
         current_mask = []
         task = []
         yes_map: Dict[str, List[List[str]]] = {}
-        no_map: Dict[str, List[List[str]]] = {}
         first = True
         for verb in verbs:
             yes_names, no_names = None, None
             if not first:
-                task += [self.sentence_term_symbol]
+                task.append(self.sentence_term_symbol)
             else:
                 first = False
             # Decide the yes names and the no names (may be empty)
-            yes = np.random.randint(len(name_map[verb]) + 1)
-            pre_yes_names: List[List[str]] = [
-                name_map[verb][g]
-                for g in np.random.choice(
-                    range(len(name_map[verb])), size=yes, replace=False
-                )
-            ]
+            yes = random.randrange(len(name_map[verb]) + 1)
+            pre_yes_names: List[List[str]] = random.sample(name_map[verb], yes)
             yes_map[verb] = pre_yes_names
             if pre_yes_names:
-                yes_names = flatten_and_merge(pre_yes_names, self.separator_symbol)
+                yes_names = flatten_and_merge(pre_yes_names)
 
-            pre_no_names = [
-                i for i in name_map[verb] if i[0] not in [n[0] for n in pre_yes_names]
-            ]
-            no_map[verb] = pre_no_names
+            yes_heads = {n[0] for n in pre_yes_names}
+            pre_no_names = [i for i in name_map[verb] if i[0] not in yes_heads]
             if pre_no_names:
-                no_names = flatten_and_merge(pre_no_names, self.separator_symbol)
+                no_names = flatten_and_merge(pre_no_names)
 
             # Build the sentence
             task += make_sentence(verb, yes_names, no_names)
 
         # Add the question part
-        task += self.construct_question(name_map, yes_map, verbs)
+        task += self.construct_question(
+            name_map, yes_map, verbs, adjective_candidates(yes_map)
+        )
 
         # Last symbol is the one to predict
         current_mask.append(len(task) - 1)
@@ -543,21 +700,16 @@ class AdjectiveLanguage(TokenTask):
         del kwargs
 
         # Choose a subset of object names to work with
-        subset_size = np.random.randint(1, len(self.object_names))
-        subset: List[str] = np.random.choice(
-            self.object_names, size=subset_size, replace=False
-        ).tolist()
+        subset_size = random.randrange(1, self._n_names)
+        subset: List[str] = random.sample(self.object_names, subset_size)
         adj_subset = make_adj_objs(self.size_adj, self.color_adj, subset)
 
         # Choose the number of verbs to use
-        n_verbs = np.random.randint(1, min(len(self.verbs), subset_size) + 1)
-        verbs: List[str] = np.random.choice(
-            self.verbs, size=n_verbs, replace=False
-        ).tolist()
+        n_verbs = random.randrange(1, min(self._n_verbs, subset_size) + 1)
+        verbs: List[str] = random.sample(self.verbs, n_verbs)
 
         name_map: Dict[str, List[List[str]]] = {}
-        indices = np.random.choice(range(len(subset)), size=n_verbs, replace=False)
-        indices = np.sort(indices)
+        indices = sorted(random.sample(range(len(subset)), n_verbs))
         for i, verb in enumerate(verbs):
             right = len(subset) if i >= len(verbs) - 1 else indices[i + 1]
             name_map[verb] = adj_subset[indices[i] : right]
@@ -568,54 +720,82 @@ class AdjectiveLanguage(TokenTask):
         name_map: Dict[str, List[List[str]]],
         yes_map: Dict[str, List[List[str]]],
         verbs: List[str],
+        candidates: Optional[List[Tuple[str, List[str]]]] = None,
     ) -> List[str]:
         """An intermediate function to construct a question from a name_map,
-        yes_map and verbs."""
-        # Choose which verb/name we will ask about
-        candidates = [(k, i) for k, c in yes_map.items() for i in c if len(i) > 1]
-
+        yes_map and verbs. `candidates` are the (verb, object) pairs an
+        adjective question can be asked about (see `adjective_candidates`,
+        computed from `yes_map` if not given)."""
+        if candidates is None:
+            candidates = adjective_candidates(yes_map)
         # If no possible answer has any adjective, we force the question to be YES/NO
         if candidates:
-            question_chooser = np.random.random()
+            question_chooser = random.random()
         else:
             question_chooser = 0
 
-        if question_chooser < 1 / (len(self.color_adj) + len(self.size_adj) + 2):
+        if question_chooser < self._p_yesno:
             # YES/NO
-            question_verb = str(np.random.choice(verbs))
+            question_verb = random.choice(verbs)
             tgt: List[str] = name_map[question_verb][
-                np.random.randint(len(name_map[question_verb]))
+                random.randrange(len(name_map[question_verb]))
             ]
             # Make the answer
-            return (
-                [self.sentence_term_symbol]
-                + ["DO", "I", question_verb, make_prefix(tgt[0])]
-                + tgt
-                + [self.query_symbol]
-                + ["YES" if tgt in yes_map[question_verb] else "NO"]
-            )
+            return [
+                self.sentence_term_symbol,
+                "DO",
+                "I",
+                question_verb,
+                make_prefix(tgt[0]),
+                *tgt,
+                self.query_symbol,
+                "YES" if tgt in yes_map[question_verb] else "NO",
+            ]
         # Question about size or color
-        question_verb, tgt = candidates[np.random.randint(len(candidates))]
+        question_verb, tgt = random.choice(candidates)
         # Select the adjective we are asking about
-        selected_adj: str = np.random.choice(tgt[:-1])
-        if selected_adj in self.color_adj:
+        selected_adj: str = random.choice(tgt[:-1])
+        if selected_adj in self._color_set:
             question = ["WHAT", "COLOR", "IS", "THE"]
-        elif selected_adj in self.size_adj:
+        elif selected_adj in self._size_set:
             question = ["WHAT", "SIZE", "IS", "THE"]
         else:
             raise ValueError(f"The adjective {selected_adj} is not in the list.")
         # Make the answer
-        return (
-            [self.sentence_term_symbol]
-            + question
-            + [tgt[-1], "I", question_verb, self.query_symbol]
-            + [selected_adj]
-        )
+        return [
+            self.sentence_term_symbol,
+            *question,
+            tgt[-1],
+            "I",
+            question_verb,
+            self.query_symbol,
+            selected_adj,
+        ]
 
 
+# pylint: disable-next=too-many-instance-attributes
 class AdjectiveLanguageCounting(TokenTask):
     """This is the same as the adjective task with an extra counting component."""
 
+    # Words of the dictionary that do not depend on the task parameters
+    _static_words: Tuple[str, ...] = (
+        "I",
+        "DO",
+        "NOT",
+        "AND",
+        "BUT",
+        "WHAT",
+        "A",
+        "AN",
+        "COLOR",
+        "SIZE",
+        "IS",
+        "THE",
+        "HOW",
+        "MANY",
+        "THINGS",
+    )
+
     def __init__(
         self,
         object_names: Optional[List[str]] = None,
@@ -624,33 +804,47 @@ class AdjectiveLanguageCounting(TokenTask):
         symbols: ElementaryLanguageSymbols = ElementaryLanguageSymbols(),
         n_questions_max: int = 8,
     ):  # pylint: disable=too-many-arguments
-        self.object_names = (
+        self.object_names = intern_tokens(
             object_names if object_names is not None else DEFAULT_OBJECT_NAMES
         )
         self.color_adj, self.size_adj = (
-            adj[0] if adj is not None else ["RED", "GREEN", "BLUE", "YELLOW"],
-            adj[1] if adj is not None else ["SMALL", "BIG", "HUGE", "TINY", "NORMAL"],
+            intern_tokens(adj[0])
+            if adj is not None
+            else ["RED", "GREEN", "BLUE", "YELLOW"],
+            intern_tokens(adj[1])
+            if adj is not None
+            else ["SMALL", "BIG", "HUGE", "TINY", "NORMAL"],
         )
         self.numbers = dict(enumerate(NUMBERS[: len(self.object_names) + 1]))
-        self.verbs = (
+        self.verbs = intern_tokens(
             verbs
             if verbs is not None
             else ["SEE", "HEAR", "CALL", "FEEL", "SMELL", "TOUCH"]
         )
         self.symbols = symbols
         self.n_questions_max = n_questions_max
-        dictionary = self.object_names + self.verbs + self.color_adj + self.size_adj
-        dictionary += ["I", "DO", "NOT", "AND", "BUT", "WHAT", "A", "AN"]
-        dictionary += ["COLOR", "SIZE", "IS", "THE"]
-        dictionary += ["HOW", "MANY", "THINGS"]
-        dictionary += list(self.numbers.values())
-        dictionary += [
+        dictionary = [
+            *self.object_names,
+            *self.verbs,
+            *self.color_adj,
+            *self.size_adj,
+            *self._static_words,
+            *self.numbers.values(),
             self.symbols.query_symbol,
             self.symbols.sentence_term_symbol,
             "YES",
             "NO",
         ]
         super().__init__("adj-qa-ct", 0, dictionary)
+        # Sizes used to draw random subsets for every sequence
+        self._n_names = len(self.object_names)
+        self._n_verbs = len(self.verbs)
+        # Thresholds of the YES/NO and HOW MANY questions for `construct_question`
+        p_ans = 1 / (len(self.numbers) + len(self.color_adj) + len(self.size_adj) + 2)
+        self._p_ans2 = 2 * p_ans
+        self._p_ans_num = (2 + len(self.numbers)) * p_ans
+        self._color_set = frozenset(self.color_adj)
+        self._size_set = frozenset(self.size_adj)
 
     def make_task_map_from_name_map(
         self, verbs: List[str], name_map: Dict[str, List[List[str]]]
@@ -662,35 +856,23 @@ class AdjectiveLanguageCounting(TokenTask):
         current_mask = []
         task = []
         yes_map: Dict[str, List[List[str]]] = {}
-        no_map: Dict[str, List[List[str]]] = {}
         first = True
         for verb in verbs:
             yes_names, no_names = None, None
             if not first:
-                task += [self.symbols.sentence_term_symbol]
+                task.append(self.symbols.sentence_term_symbol)
             else:
                 first = False
             # Decide the yes names and the no names (may be empty)
-            yes = np.random.randint(len(name_map[verb]) + 1)
-            pre_yes_names: List[List[str]] = [
-                name_map[verb][g]
-                for g in np.random.choice(
-                    range(len(name_map[verb])), size=yes, replace=False
-                )
-            ]
+            yes = random.randrange(len(name_map[verb]) + 1)
+            pre_yes_names: List[List[str]] = random.sample(name_map[verb], yes)
             yes_map[verb] = pre_yes_names
             if pre_yes_names:
-                yes_names = flatten_and_merge(
-                    pre_yes_names, self.symbols.separator_symbol
-                )
-            pre_no_names = [
-                i for i in name_map[verb] if i[0] not in [n[0] for n in pre_yes_names]
-            ]
-            no_map[verb] = pre_no_names
+                yes_names = flatten_and_merge(pre_yes_names)
+            yes_heads = {n[0] for n in pre_yes_names}
+            pre_no_names = [i for i in name_map[verb] if i[0] not in yes_heads]
             if pre_no_names:
-                no_names = flatten_and_merge(
-                    pre_no_names, self.symbols.separator_symbol
-                )
+                no_names = flatten_and_merge(pre_no_names)
 
             # Build the sentence
             task += make_sentence(verb, yes_names, no_names)
@@ -711,12 +893,15 @@ class AdjectiveLanguageCounting(TokenTask):
         """This intermediate method produces a question list from the name_map,
         yes_map and verb to be added to the final sequence."""
 
-        question_set = set()
+        # The candidates of adjective questions are shared by all questions
+        candidates = adjective_candidates(yes_map)
+        question_set: Set[Tuple[str, ...]] = set()
         question_list = []
-        for _ in range(np.random.randint(1, self.n_questions_max)):
-            question = self.construct_question(name_map, yes_map, verbs)
-            if self.symbols.separator_symbol.join(question) not in question_set:
-                question_set.add(self.symbols.separator_symbol.join(question))
+        for _ in range(random.randrange(1, self.n_questions_max)):
+            question = self.construct_question(name_map, yes_map, verbs, candidates)
+            key = tuple(question)
+            if key not in question_set:
+                question_set.add(key)
                 question_list.append(question)
         return question_list
 
@@ -724,21 +909,16 @@ class AdjectiveLanguageCounting(TokenTask):
         del kwargs
 
         # Choose a subset of object names to work with
-        subset_size = np.random.randint(1, len(self.object_names))
-        subset: List[str] = np.random.choice(
-            self.object_names, size=subset_size, replace=False
-        ).tolist()
+        subset_size = random.randrange(1, self._n_names)
+        subset: List[str] = random.sample(self.object_names, subset_size)
         adj_subset = make_adj_objs(self.size_adj, self.color_adj, subset)
 
         # Choose the number of verbs to use
-        n_verbs = np.random.randint(1, min(len(self.verbs), subset_size) + 1)
-        verbs: List[str] = np.random.choice(
-            self.verbs, size=n_verbs, replace=False
-        ).tolist()
+        n_verbs = random.randrange(1, min(self._n_verbs, subset_size) + 1)
+        verbs: List[str] = random.sample(self.verbs, n_verbs)
 
         name_map: Dict[str, List[List[str]]] = {}
-        indices = np.random.choice(range(len(subset)), size=n_verbs, replace=False)
-        indices = np.sort(indices)
+        indices = sorted(random.sample(range(len(subset)), n_verbs))
         for i, verb in enumerate(verbs):
             right = len(subset) if i >= len(verbs) - 1 else indices[i + 1]
             name_map[verb] = adj_subset[indices[i] : right]
@@ -749,42 +929,45 @@ class AdjectiveLanguageCounting(TokenTask):
         name_map: Dict[str, List[List[str]]],
         yes_map: Dict[str, List[List[str]]],
         verbs: List[str],
+        candidates: Optional[List[Tuple[str, List[str]]]] = None,
     ) -> List[str]:
         """An intermediate function to construct a question from a name_map,
-        yes_map and verbs.
+        yes_map and verbs. `candidates` are the (verb, object) pairs an
+        adjective question can be asked about (see `adjective_candidates`,
+        computed from `yes_map` if not given).
 
         """
-        # Choose which verb/name we will ask about
-        candidates = [(k, i) for k, c in yes_map.items() for i in c if len(i) > 1]
-
+        if candidates is None:
+            candidates = adjective_candidates(yes_map)
         # If no possible answer has any adjective, we force the question to be YES/NO
         if candidates:
-            question_chooser = np.random.random()
+            question_chooser = random.random()
         else:
             question_chooser = 0
-        p_ans = 1 / (len(self.numbers) + len(self.color_adj) + len(self.size_adj) + 2)
-        if question_chooser < 2 * p_ans:
+        if question_chooser < self._p_ans2:
             # YES/NO
-            question_verb = str(np.random.choice(verbs))
+            question_verb = random.choice(verbs)
             tgt: List[str] = name_map[question_verb][
-                np.random.randint(len(name_map[question_verb]))
+                random.randrange(len(name_map[question_verb]))
             ]
             # Make the answer
-            return (
-                [self.symbols.sentence_term_symbol]
-                + ["DO", "I", question_verb, make_prefix(tgt[0])]
-                + tgt
-                + [
-                    self.symbols.query_symbol,
-                    "YES" if tgt in yes_map[question_verb] else "NO",
-                ]
-            )
-        if question_chooser < (2 + len(self.numbers)) * p_ans:
+            return [
+                self.symbols.sentence_term_symbol,
+                "DO",
+                "I",
+                question_verb,
+                make_prefix(tgt[0]),
+                *tgt,
+                self.symbols.query_symbol,
+                "YES" if tgt in yes_map[question_verb] else "NO",
+            ]
+        if question_chooser < self._p_ans_num:
             # HOW MANY ...
-            question_verb = str(np.random.choice(verbs))
+            question_verb = random.choice(verbs)
             number_of_things = self.numbers[len(yes_map[question_verb])]
             # Make the answer
-            return [self.symbols.sentence_term_symbol] + [
+            return [
+                self.symbols.sentence_term_symbol,
                 "HOW",
                 "MANY",
                 "THINGS",
@@ -796,19 +979,22 @@ class AdjectiveLanguageCounting(TokenTask):
             ]
 
         # Question about size or color
-        question_verb, tgt = candidates[np.random.randint(len(candidates))]
+        question_verb, tgt = random.choice(candidates)
         # Select the adjective we are asking about
-        selected_adj: str = np.random.choice(tgt[:-1])
-        if selected_adj in self.color_adj:
+        selected_adj: str = random.choice(tgt[:-1])
+        if selected_adj in self._color_set:
             question = ["WHAT", "COLOR", "IS", "THE"]
-        elif selected_adj in self.size_adj:
+        elif selected_adj in self._size_set:
             question = ["WHAT", "SIZE", "IS", "THE"]
         else:
             raise ValueError(f"The adjective {selected_adj} is not in the list.")
         # Make the answer
-        return (
-            [self.symbols.sentence_term_symbol]
-            + question
-            + [tgt[-1], "I", question_verb, self.symbols.query_symbol]
-            + [selected_adj]
-        )
+        return [
+            self.symbols.sentence_term_symbol,
+            *question,
+            tgt[-1],
+            "I",
+            question_verb,
+            self.symbols.query_symbol,
+            selected_adj,
+        ]
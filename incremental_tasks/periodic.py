@@ -1,81 +1,126 @@
 """This module implements the periodic-style tasks."""
-from typing import List, Optional, Union
+import functools
+from abc import abstractmethod
+from typing import Callable, List, Optional, Tuple, Union
 
 import numpy as np
 
+from ._rng import new_rng
 from .base import BinaryTask, SingleTM
 
+# Periods up to this number of bits are formatted with a lookup table
+MAX_TABLE_BITS = 12
 
-class Periodic(BinaryTask):
+
+@functools.lru_cache(maxsize=None)
+def _binary_table(n_bits: int) -> Tuple[str, ...]:
+    """The binary representations of all the `n_bits` integers (built once per
+    number of bits)."""
+    return tuple(format(i, f"0{n_bits}b") for i in range(1 << n_bits))
+
+
+def binary_formatter(n_bits: int) -> Callable[[int], str]:
+    """Returns a function formatting integers to their `n_bits` binary
+    digits."""
+    if n_bits <= MAX_TABLE_BITS:
+        return _binary_table(n_bits).__getitem__
+    return f"{{:0{n_bits}b}}".format
+
+
+def binary_digits(value: int, n_bits: int) -> List[str]:
+    """Returns the `n_bits` binary digits of `value` as a list of "0"/"1"
+    symbols (most significant first)."""
+    return list(binary_formatter(n_bits)(value))
+
+
+class PeriodicTask(BinaryTask):
+    """Base class of the periodic tasks, whose sequences are generated from
+    their length `seq_len` (100 by default) only. The sub-classes draw them from
+    a random generator seeded with their `seed` argument."""
+
+    @abstractmethod
+    def generate_sequence(self, seq_len: int) -> SingleTM:
+        """Generates a single pair of sequence/mask of length `seq_len`."""
+        raise NotImplementedError
+
+    def generate_single(self, **kwargs) -> SingleTM:
+        return self.generate_sequence(kwargs.get("seq_len", 100))
+
+    def generate_batch(self, n_seq: int, **kwargs) -> List[SingleTM]:
+        # The keyword arguments are only looked up once for the whole batch
+        generate_sequence = self.generate_sequence
+        seq_len = kwargs.get("seq_len", 100)
+        return [generate_sequence(seq_len) for _ in range(n_seq)]
+
+
+class Periodic(PeriodicTask):
     """Generate all binary periodic sequences with lengths."""
 
-    def __init__(self, lengths: Optional[Union[int, List[int]]] = None):
+    def __init__(
+        self,
+        lengths: Optional[Union[int, List[int]]] = None,
+        seed: Optional[int] = None,
+    ):
         if lengths is None:
             lengths = [10]
         super().__init__("periodic", lengths)
-
-    def generate_single(self, **kwargs) -> SingleTM:
-        seq_len = kwargs.get("seq_len", 100)
-        period = np.random.choice(self.lengths)
-        sequence = np.random.choice(np.arange(0, 2**period))
-        formatted_string = f"{{0:0{period}b}}"
-        base = [int(i) for i in formatted_string.format(sequence)]
-        task = base * (seq_len // len(base))
-        task = (task + base[: seq_len - len(task)])[:]
-        task_list = [str(i) for i in task]
-        masking_limit = np.random.randint(0, max(period - 1, 1))
+        self._rng = new_rng(seed)
+
+    def generate_sequence(self, seq_len: int) -> SingleTM:
+        rng = self._rng
+        period = self.lengths[rng.integers(len(self.lengths))]
+        sequence = int(rng.integers(2**period))
+        base = binary_digits(sequence, period)
+        task_list = (base * (seq_len // period + 1))[:seq_len]
+        masking_limit = int(rng.integers(max(period - 1, 1)))
         return task_list, list(range(2 * period + masking_limit, len(task_list)))
 
 
-class IncreasingPeriod(BinaryTask):
+class IncreasingPeriod(PeriodicTask):
     """Generate all binary periodic sequences with increasing periods with
     lengths.
     """
 
-    def __init__(self, lengths: Optional[Union[int, List[int]]] = None):
+    def __init__(
+        self,
+        lengths: Optional[Union[int, List[int]]] = None,
+        seed: Optional[int] = None,
+    ):
         if lengths is None:
             lengths = [10]
         super().__init__("inc-per", lengths)
-
-    def generate_single(self, **kwargs) -> SingleTM:
-        seq_len = kwargs.get("seq_len", 100)
-        base_period = np.random.choice(self.lengths)
-        sequence = np.random.choice(np.arange(0, 2**base_period))
-        formatted_string = f"{{0:0{base_period}b}}"
-        base = [int(i) for i in formatted_string.format(sequence)]
-        task = base[:]
+        self._rng = new_rng(seed)
+
+    def generate_sequence(self, seq_len: int) -> SingleTM:
+        rng = self._rng
+        base_period = self.lengths[rng.integers(len(self.lengths))]
+        sequence = int(rng.integers(2**base_period))
+        base = binary_digits(sequence, base_period)
+        task_list = base[:]
         count = 2
-        while len(task) < seq_len:
-            task = (
-                task
-                + np.concatenate(
-                    [np.array(base)[:, None] for _ in range(count)], axis=1
-                )
-                .reshape(-1)
-                .tolist()
-            )
+        # The n-th repetition of the period repeats each of its digits n times
+        while len(task_list) < seq_len:
+            for digit in base:
+                task_list += [digit] * count
             count += 1
+        del task_list[seq_len:]
 
-        task = task[:seq_len]
-        task_list = [str(i) for i in task]
-        masking_limit = np.random.randint(0, max(base_period - 1, 1))
+        masking_limit = int(rng.integers(max(base_period - 1, 1)))
         return task_list, list(range(3 * base_period + masking_limit, len(task_list)))
 
 
-class RandomPeriodic(BinaryTask):
+class RandomPeriodic(PeriodicTask):
     """Generate random sequences with N-Grams of length in lenghts."""
 
-    def __init__(self, lengths: Union[int, List[int]]):
+    def __init__(self, lengths: Union[int, List[int]], seed: Optional[int] = None):
         super().__init__("rand-per", lengths)
+        self._rng = new_rng(seed)
 
-    def generate_single(self, **kwargs) -> SingleTM:
-        seq_len = kwargs.get("seq_len", 100)
-        period = np.random.choice(self.lengths)
-        random_seq: np.ndarray = np.random.randint(
+    def generate_sequence(self, seq_len: int) -> SingleTM:
+        period = self.lengths[self._rng.integers(len(self.lengths))]
+        random_seq: np.ndarray = self._rng.integers(
             2**period, size=(1 + seq_len // period)
         )
-        formatted_string = f"{{0:0{period}b}}"
-        task = [i for q in random_seq for i in formatted_string.format(q)][:seq_len]
-
-        task_list = [str(i) for i in task]
+        digits = "".join(map(binary_formatter(period), random_seq.tolist()))
+        task_list = list(digits[:seq_len])
         return task_list, list(range(1, len(task_list)))
@@ -1,10 +1,12 @@
-"""This module implements the symbolic tasks."""
+"""This module implements the symbolic tasks. Their sequences are drawn from
+a random generator seeded with the `seed` argument of the task."""
 import collections
 from dataclasses import dataclass
 from typing import List, Optional, Union
 
 import numpy as np
 
+from ._rng import new_rng
 from .base import SingleTM, TokenTask
 
 
@@ -17,7 +19,8 @@ class SymbolCounting(TokenTask):
         dictionary: Optional[List[str]] = None,
         query_symbol: str = "x",
         eol_symbol: str = ".",
-    ):
+        seed: Optional[int] = None,
+    ):  # pylint: disable=too-many-arguments
         if lengths is None:
             lengths = [10]
         if dictionary is None:
@@ -28,23 +31,30 @@ class SymbolCounting(TokenTask):
             dictionary + [query_symbol, eol_symbol] + [str(i) for i in range(10)],
         )
         assert query_symbol not in dictionary
-        assert np.all([len(i) == 1 for i in dictionary])
+        assert all(len(i) == 1 for i in dictionary)
         self.query_symbol = query_symbol
         self.eol_symbol = eol_symbol
         self.base_dic = dictionary
+        self._rng = new_rng(seed)
+        # Symbols are drawn by indexing this array with random integers, which
+        # is cheaper than `Generator.choice`
+        self._symbols = np.array(dictionary)
 
     def generate_single(self, **kwargs) -> SingleTM:
         del kwargs
-        base_len = np.random.choice(self.lengths)
+        rng = self._rng
+        base_len = self.lengths[rng.integers(len(self.lengths))]
         current_task_mask = []
-        n_queries = np.random.randint(1, len(self.base_dic) + 1)
-        left = np.random.choice(self.base_dic, size=base_len, replace=True).tolist()
-        counter: collections.Counter = collections.Counter(left)
-
-        symbol_choice = np.random.choice(self.base_dic, size=n_queries, replace=False)
-        for symbol in symbol_choice:
-            left = left + [self.query_symbol, symbol] + list(str(counter[symbol]))
-            for i in reversed(range(len(str(counter[symbol])))):
+        n_queries = rng.integers(1, len(self.base_dic) + 1)
+        n_symbols = len(self.base_dic)
+        left_ids = rng.integers(n_symbols, size=base_len)
+        left = self._symbols[left_ids].tolist()
+        counts = np.bincount(left_ids, minlength=n_symbols).tolist()
+
+        for symbol_id in rng.permutation(n_symbols)[:n_queries].tolist():
+            count_digits = list(str(counts[symbol_id]))
+            left += [self.query_symbol, self.base_dic[symbol_id], *count_digits]
+            for i in reversed(range(len(count_digits))):
                 current_task_mask.append(len(left) - 1 - i)
         left.append(self.eol_symbol)
         return left, current_task_mask
@@ -60,9 +70,10 @@ class HardSymCountingSymbols:
     eol_symbol: str = "."
 
 
+# pylint: disable-next=too-many-instance-attributes
 class HardSymbolCounting(TokenTask):
     """The 'pattern' counting task. Instead of counting symbols, exact matches
-    of groups of symbols must be found
+    of groups of symbols must be found.
 
     """
 
@@ -71,6 +82,7 @@ class HardSymbolCounting(TokenTask):
         lengths: Optional[Union[int, List[int]]] = None,
         dictionary: Optional[List[str]] = None,
         symbols: HardSymCountingSymbols = HardSymCountingSymbols(),
+        seed: Optional[int] = None,
     ):
         if lengths is None:
             lengths = [45]
@@ -85,62 +97,65 @@ class HardSymbolCounting(TokenTask):
             + [str(i) for i in range(10)],
         )
         assert symbols.query_symbol not in dictionary
-        assert np.all([len(i) == 1 for i in dictionary])
+        assert all(len(i) == 1 for i in dictionary)
         self.query_symbol = symbols.query_symbol
         self.separator_symbol = symbols.separator_symbol
         self.base_dic = dictionary + [symbols.separator_symbol]
         self.eol_symbol = symbols.eol_symbol
+        self._rng = new_rng(seed)
+        # Symbols the patterns are drawn from. The separator is drawn
+        # 2 * len(base_dic) + 1 times more often than the other symbols, by
+        # inverting the cumulative distribution of the weights.
+        self._pool = np.array(self.base_dic)
+        self._pool_is_sep = self._pool == self.separator_symbol
+        weights = np.where(self._pool_is_sep, 2 * len(self.base_dic) + 1, 1)
+        self._pool_cdf = np.cumsum(weights) / weights.sum()
+        self._pool_cdf[-1] = 1.0
+
+    def _draw_patterns(self, size: int) -> List[str]:
+        """Draws `size` symbols and returns them without the leading, trailing
+        and repeated separators (an empty list if they are all separators)."""
+        idx = self._pool_cdf.searchsorted(self._rng.random(size), side="right")
+        is_sep = self._pool_is_sep[idx]
+        symbol_pos = np.flatnonzero(~is_sep)
+        if not symbol_pos.size:
+            return []
+        idx = idx[symbol_pos[0] : symbol_pos[-1] + 1]
+        is_sep = is_sep[symbol_pos[0] : symbol_pos[-1] + 1]
+        # Separators following another separator are dropped
+        keep = np.ones(len(idx), dtype=bool)
+        keep[1:] = ~(is_sep[1:] & is_sep[:-1])
+        return self._pool[idx[keep]].tolist()
 
     def generate_single(self, **kwargs) -> SingleTM:
         del kwargs
-        base_len = np.random.choice(self.lengths)
+        rng = self._rng
+        base_len = self.lengths[rng.integers(len(self.lengths))]
         current_task_mask = []
         left: list[str] = []
         while not left:
-            left = np.random.choice(
-                self.base_dic + [self.separator_symbol] * 2 * len(self.base_dic),
-                size=int(2.5 * base_len),
-                replace=True,
-            ).tolist()
-            while left and left[0] == self.separator_symbol:
-                left.pop(0)
-            while left and left[-1] == self.separator_symbol:
-                left.pop(0)
-            # No duplicates separator symbols
-            left = [
-                v
-                for i, v in enumerate(left)
-                if (
-                    i == 0
-                    or (v == self.separator_symbol and v != left[i - 1])
-                    or v != self.separator_symbol
-                )
-            ]
+            left = self._draw_patterns(int(2.5 * base_len))
 
         # Add the query part
         counter = collections.Counter("".join(left).split(self.separator_symbol))
-        n_queries = np.random.randint(1, len(counter.keys()) + 1)
+        n_queries = rng.integers(1, len(counter.keys()) + 1)
 
-        pattern_choice = np.random.choice(
-            list(counter.keys()), size=n_queries, replace=False
-        )
-        left = left + [self.query_symbol]
+        patterns = list(counter)
+        pattern_choice = [
+            patterns[i] for i in rng.permutation(len(patterns))[:n_queries].tolist()
+        ]
+        left.append(self.query_symbol)
         for pattern in pattern_choice:
-
-            left = (
-                left
-                + list(pattern)
-                + [self.separator_symbol]
-                + list(str(counter[pattern]))
-            )
-            for i in range(len(str(counter[pattern]))):
+            count_digits = list(str(counter[pattern]))
+            left += [*pattern, self.separator_symbol, *count_digits]
+            for i in range(len(count_digits)):
                 current_task_mask.append(len(left) - 1 - i)
-            if np.random.random() > 0.2:
+            if rng.random() > 0.2:
                 negative = list(3 * pattern[:])
-                np.random.shuffle(negative)
-                negative = negative[: len(pattern) + np.random.randint(-2, 3)]
+                rng.shuffle(negative)
+                negative = negative[: len(pattern) + rng.integers(-2, 3)]
                 if negative and "".join(negative) not in pattern:
-                    left = left + negative + [self.separator_symbol, "0"]
+                    left += [*negative, self.separator_symbol, "0"]
                     current_task_mask.append(len(left) - 1)
         left.append(self.eol_symbol)
         return left, current_task_mask
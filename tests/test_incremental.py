@@ -1,6 +1,116 @@
 """Test general package things."""
-from incremental_tasks import __version__
+import pathlib
+import re
+import subprocess
+import sys
+
+import pytest
+
+import incremental_tasks
+from incremental_tasks import (
+    BinarizedTask,
+    ElementaryLanguage,
+    HybridTask,
+    Periodic,
+    SymbolCounting,
+    __version__,
+)
+from incremental_tasks.base import get_idx
 
 
 def test_version():
     assert __version__ == "0.1.3"
+
+
+def test_version_matches_pyproject():
+    pyproject = pathlib.Path(__file__).parents[1] / "pyproject.toml"
+    match = re.search(r'^version = "(.*)"$', pyproject.read_text(), re.MULTILINE)
+    assert match is not None
+    assert __version__ == match.group(1)
+
+
+def test_cli_version_without_numpy():
+    # `--version` must not load numpy (run in a fresh interpreter since the
+    # tests already imported it)
+    code = (
+        "import sys\n"
+        "from incremental_tasks.cli import main\n"
+        "sys.argv = ['gen', '--version']\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('numpy' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        cwd=pathlib.Path(__file__).parents[1],
+        text=True,
+    )
+    assert result.stdout.splitlines() == [f"gen {__version__}", "False"]
+
+
+def test_lazy_attributes():
+    assert incremental_tasks.ID_TO_TASK[1] is incremental_tasks.Periodic
+    assert set(incremental_tasks.ID_TO_TASK) == set(
+        incremental_tasks.NAME_TO_ID.values()
+    )
+    for task_id, task_class in incremental_tasks.ID_TO_TASK.items():
+        assert incremental_tasks.get_task_class(task_id) is task_class
+    with pytest.raises(KeyError):
+        incremental_tasks.get_task_class(0)
+    with pytest.raises(AttributeError):
+        getattr(incremental_tasks, "NotATask")
+    assert "get_task_class" in incremental_tasks.__all__
+    assert "get_task_class" in dir(incremental_tasks)
+
+
+def test_encode():
+    task = SymbolCounting()
+    sentence = ["A", "C", "x", "C", "1", "."]
+    assert task.encode(sentence) == [0, 2, 3, 2, 6, 4]
+    assert task.encode(sentence) == get_idx(sentence, task.dictionary)
+
+    # Reassigning the dictionary invalidates the cached mapping
+    task.dictionary = ["B", "A"] + task.dictionary[2:]
+    assert task.encode(["A", "B"]) == [1, 0]
+
+
+def test_convert_to_binary():
+    task = BinarizedTask(SymbolCounting())
+    assert task.enc_size == 4
+    binary, mask = task.convert_to_binary(["B", "x", "3"], [2])
+    assert "".join(binary) == "000100111000"
+    assert mask == [8, 9, 10, 11]
+    assert task.convert_to_binary(["A"], None) == (["0", "0", "0", "0"], None)
+
+
+def test_sample_cache():
+    task = Periodic()
+    n_items = task.get_n_items_per_seq()
+    sample = task._get_sample()  # pylint: disable=protected-access
+    assert task.get_true_output_size() == 2
+    assert task._get_sample() is sample  # pylint: disable=protected-access
+    assert task.get_n_items_per_seq() == n_items
+    task.set_lengths([5])
+    assert task._get_sample() is not sample  # pylint: disable=protected-access
+
+
+@pytest.mark.parametrize(
+    "task",
+    [
+        Periodic(),
+        ElementaryLanguage(),
+        BinarizedTask(SymbolCounting()),
+        HybridTask({"periodic": Periodic, "qa": ElementaryLanguage}, {}),
+    ],
+    ids=["periodic", "language", "binarized", "hybrid"],
+)
+def test_generate_parallel(task):
+    batch = task.generate_parallel(30, n_workers=2, seed=0)
+    assert len(batch) == 30
+    assert all(set(sentence) <= set(task.dictionary) for sentence, _ in batch)
+    assert task.generate_parallel(30, n_workers=2, seed=0) == batch
+    assert task.generate_parallel(30, n_workers=2, seed=1) != batch
@@ -1,5 +1,25 @@
 """Tests for the language tasks."""
-from incremental_tasks.language import add_no, add_yes
+import random
+
+import numpy as np
+import pytest
+
+import incremental_tasks
+from incremental_tasks.language import (
+    LINK_WORDS,
+    AdjectiveLanguage,
+    AdjectiveLanguageCounting,
+    ElementaryLanguage,
+    ElementaryLanguageWithWorldDef,
+    ElementaryLanguageWithWorldDefCounting,
+    HarderElementaryLanguage,
+    add_no,
+    add_yes,
+    adjective_candidates,
+    flatten_and_merge,
+    interleave,
+    make_sentence,
+)
 
 
 def test_add_yes():
@@ -14,3 +34,167 @@ def test_add_no():
     no_names = ["TOM", "JAMES"]
     assert add_no(verb, no_names) == ["I", "DO", "NOT", "HEAR", "TOM", "JAMES"]
     assert add_no(verb, None) == []
+
+
+def test_adjective_candidates():
+    yes_map = {"SEE": [["RED", "CAR"], ["APPLE"]], "HEAR": [["BIG", "RED", "DOG"]]}
+    assert adjective_candidates(yes_map) == [
+        ("SEE", ["RED", "CAR"]),
+        ("HEAR", ["BIG", "RED", "DOG"]),
+    ]
+    assert adjective_candidates({"SEE": [["APPLE"]]}) == []
+
+
+@pytest.mark.parametrize("task_class", [AdjectiveLanguage, AdjectiveLanguageCounting])
+def test_construct_question_candidates(task_class):
+    # Without candidates, they are computed from the yes map
+    task = task_class()
+    name_map = {"SEE": [["RED", "CAR"], ["APPLE"]], "HEAR": [["BIG", "RED", "DOG"]]}
+    yes_map = {"SEE": [["RED", "CAR"]], "HEAR": []}
+    candidates = adjective_candidates(yes_map)
+    for seed in range(20):
+        random.seed(seed)
+        question = task.construct_question(name_map, yes_map, ["SEE", "HEAR"])
+        random.seed(seed)
+        assert question == task.construct_question(
+            name_map, yes_map, ["SEE", "HEAR"], candidates
+        )
+
+
+def test_interleave():
+    assert interleave(["TOM", "JAMES", "PAUL"]) == [
+        "TOM",
+        "AND",
+        "JAMES",
+        "AND",
+        "PAUL",
+    ]
+    assert interleave(["TOM"]) == ["TOM"]
+    assert interleave([]) == []
+
+
+def test_flatten_and_merge():
+    assert flatten_and_merge([["BIG", "RED", "APPLE"], ["ORANGE"], ["CAR"]]) == [
+        "A",
+        "BIG",
+        "RED",
+        "APPLE",
+        "AND",
+        "AN",
+        "ORANGE",
+        "AND",
+        "A",
+        "CAR",
+    ]
+    assert flatten_and_merge([]) == []
+    # The separator argument is ignored
+    assert flatten_and_merge([["CAR"]], " ") == ["A", "CAR"]
+
+
+def test_make_sentence():
+    yes_part = ["I", "HEAR", "TOM"]
+    no_part = ["I", "DO", "NOT", "HEAR", "JAMES"]
+    for _ in range(20):
+        sentence = make_sentence("HEAR", ["TOM"], ["JAMES"])
+        assert sentence in (
+            [*yes_part, "AND", *no_part],
+            [*yes_part, "BUT", *no_part],
+            [*no_part, "AND", *yes_part],
+            [*no_part, "BUT", *yes_part],
+        )
+    assert make_sentence("HEAR", ["TOM"], None) == yes_part
+    assert make_sentence("HEAR", None, ["JAMES"]) == no_part
+    # The default link words are also used when `None` is given explicitly
+    sentence = make_sentence("HEAR", ["TOM"], ["JAMES"], link_words=None)
+    assert len(set(sentence) & set(LINK_WORDS)) == 1
+
+
+@pytest.mark.parametrize(
+    "task_class",
+    [
+        ElementaryLanguage,
+        HarderElementaryLanguage,
+        ElementaryLanguageWithWorldDef,
+        ElementaryLanguageWithWorldDefCounting,
+        AdjectiveLanguage,
+        AdjectiveLanguageCounting,
+    ],
+)
+def test_generated_symbols(task_class):
+    task = task_class()
+    dictionary = set(task.dictionary)
+    for _ in range(200):
+        sentence, mask = task.generate_single()
+        assert set(sentence) <= dictionary
+        assert mask and all(0 <= i < len(sentence) for i in mask)
+
+
+def test_str_subclass_tokens():
+    # Tokens that are str subclasses (e.g. read with numpy) are accepted
+    task = ElementaryLanguage(object_names=list(np.array(["TOM", "PAUL", "JOHN"])))
+    sentence, _ = task.generate_single()
+    assert set(sentence) <= set(task.dictionary)
+    assert all(type(token) is str for token in task.object_names)
+
+
+def test_single_name_sequences():
+    # With two object names, every subset contains a single name
+    task = ElementaryLanguage(object_names=["TOM", "PAUL"], verbs=["SEE"])
+    answers = set()
+    for _ in range(50):
+        sentence, mask = task.generate_single()
+        name = sentence[-3]
+        assert sentence in (
+            ["I", "SEE", name, ".", "DO", "I", "SEE", name, "?", "YES"],
+            ["I", "DO", "NOT", "SEE", name, ".", "DO", "I", "SEE", name, "?", "NO"],
+        )
+        assert mask == [len(sentence) - 1]
+        answers.add(sentence[-1])
+    assert answers == {"YES", "NO"}
+
+
+def test_generate_batch():
+    task = ElementaryLanguage()
+    dictionary = set(task.dictionary)
+    batch = task.generate_batch(200)
+    assert len(batch) == 200
+    for sentence, mask in batch:
+        assert set(sentence) <= dictionary
+        assert mask == [len(sentence) - 1]
+        assert sentence[-1] in ("YES", "NO")
+
+    # Sub-classes with their own sentences fall back to `generate_single`
+    world_task = ElementaryLanguageWithWorldDef()
+    for sentence, _ in world_task.generate_batch(20):
+        assert set(sentence) <= set(world_task.dictionary)
+
+
+@pytest.mark.parametrize(
+    "task_class", [ElementaryLanguage, ElementaryLanguageWithWorldDef]
+)
+def test_generate_single_into(task_class):
+    task = task_class()
+    dictionary = set(task.dictionary)
+    task_buf, mask_buf = [], []
+    for _ in range(50):
+        task_buf.clear()
+        mask_buf.clear()
+        task.generate_single_into(task_buf, mask_buf)
+        assert set(task_buf) <= dictionary
+        assert mask_buf and task_buf[mask_buf[-1]] in ("YES", "NO")
+
+    # Appending to non-empty buffers offsets the mask
+    task_buf.clear()
+    mask_buf.clear()
+    task.generate_single_into(task_buf, mask_buf)
+    task.generate_single_into(task_buf, mask_buf)
+    assert mask_buf[-1] == len(task_buf) - 1
+
+
+@pytest.mark.parametrize("task_class", [ElementaryLanguage, AdjectiveLanguage])
+def test_global_seed(task_class):
+    # The language tasks also draw from the `random` module
+    incremental_tasks.seed(0)
+    batch = task_class().generate_batch(20)
+    incremental_tasks.seed(0)
+    assert task_class().generate_batch(20) == batch
@@ -1,28 +1,31 @@
 """Tests for the periodic tasks"""
-import numpy as np
-
-from incremental_tasks.periodic import IncreasingPeriod, Periodic
+import incremental_tasks
+from incremental_tasks.periodic import (
+    IncreasingPeriod,
+    Periodic,
+    RandomPeriodic,
+    binary_digits,
+)
 
 sequences_periodic = [
+    "10100011010100011010",
+    "01001001001001001001",
     "00000000000000000000",
-    "01110111011101110111",
-    "01010101010101010101",
-    "10111101111011110111",
-    "00101100000101100000",
+    "11111111111111111111",
+    "11101001110100111010",
 ]
 
 sequences_increasing = [
+    "10100011011001100000",
+    "01000110000011100000",
     "00000000000000000000",
-    "01110011111100011111",
-    "01010011001100011100",
-    "10111110011111111100",
-    "00101100000001100111",
+    "11111111111111111111",
+    "11101001111110011000",
 ]
 
 
 def test_periodic_basic():
-    np.random.seed(0)
-    task = Periodic()
+    task = Periodic(seed=0)
 
     for idx in range(5):
         seq = task.generate_single()
@@ -30,9 +33,40 @@ def test_periodic_basic():
 
 
 def test_periodic_increasing():
-    np.random.seed(0)
-    task = IncreasingPeriod()
+    task = IncreasingPeriod(seed=0)
 
     for idx in range(5):
         seq = task.generate_single()
         assert "".join(seq[0])[:20] == sequences_increasing[idx]
+
+
+def test_binary_digits():
+    assert binary_digits(5, 4) == ["0", "1", "0", "1"]
+    assert binary_digits(0, 3) == ["0", "0", "0"]
+    # Wide periods are formatted without a lookup table
+    assert binary_digits(5, 20) == list("00000000000000000101")
+
+
+def test_periodic_length():
+    for task in (Periodic([3, 7]), IncreasingPeriod([3, 7]), RandomPeriodic([3, 7])):
+        for seq_len in (1, 5, 37, 100):
+            seq, _ = task.generate_single(seq_len=seq_len)
+            assert len(seq) == seq_len
+
+
+def test_global_seed():
+    # Without a seed, the generators are spawned from the package root seed
+    for task_class in (Periodic, IncreasingPeriod):
+        incremental_tasks.seed(0)
+        first, second = task_class(), task_class()
+        batch = first.generate_batch(5)
+        assert second.generate_batch(5) != batch
+        incremental_tasks.seed(0)
+        assert task_class().generate_batch(5) == batch
+
+
+def test_periodic_batch():
+    for task in (Periodic(), IncreasingPeriod(), RandomPeriodic([4])):
+        batch = task.generate_batch(10, seq_len=30)
+        assert len(batch) == 10
+        assert all(len(seq) == 30 for seq, _ in batch)
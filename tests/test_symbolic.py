@@ -1,38 +1,53 @@
 """Test for the symbolic tasks."""
-import numpy as np
-
 from incremental_tasks.symbolic import HardSymbolCounting, SymbolCounting
 
 sequences_symbol_counting = [
-    "BBCACAxB2.",
-    "CAxA1xC1xB0.",
-    "ABAABCACABxA5xC2.",
-    "ABBBxC0xB3xA1.",
-    "CACAAxC2xB0xA3.",
+    "BAAAAAACBxA6xC1.",
+    "CBBBCACxB3xC3xA1.",
+    "BACCxA1xB1xC2.",
+    "AxC0xA1xB0.",
+    "BBAxB2xC0.",
 ]
 
 sequences_pattern_counting = [
-    "BAyCyDyCyEyDyByDyDyE",
-    "DyDyCyAEyCByByByCxAE",
-    "AyEByEyDyByDyBxBy2.",
-    "DyCyDyDyEyDyBAyDyByC",
-    "AyAyEyEyEyDyAyByEDyE",
+    "EAAyAyAyDyACyCyEyByE",
+    "EEyECyCyAyAyByEyCyBy",
+    "BxBy1BBy0.",
+    "EyCyAyCyByByCyAyDyCy",
+    "CyEyEBAyDyByEyByADyC",
 ]
 
 
 def test_symbol_counting():
-    np.random.seed(0)
-    task = SymbolCounting()
+    task = SymbolCounting(seed=0)
 
     for idx in range(5):
         seq = task.generate_single()
         assert "".join(seq[0])[:20] == sequences_symbol_counting[idx]
 
 
+def test_symbol_counts():
+    task = SymbolCounting([20], seed=0)
+    for _ in range(200):
+        sentence = "".join(task.generate_single()[0]).rstrip(".")
+        base, *queries = sentence.split("x")
+        assert len(set(query[0] for query in queries)) == len(queries)
+        for query in queries:
+            assert base.count(query[0]) == int(query[1:])
+
+
 def test_pattern_counting():
-    np.random.seed(0)
-    task = HardSymbolCounting()
+    task = HardSymbolCounting(seed=0)
 
     for idx in range(5):
         seq = task.generate_single()
         assert "".join(seq[0])[:20] == sequences_pattern_counting[idx]
+
+
+def test_pattern_separators():
+    task = HardSymbolCounting([10], seed=0)
+    for _ in range(200):
+        patterns = "".join(task.generate_single()[0]).split("x")[0]
+        assert patterns
+        assert not patterns.startswith("y") and not patterns.endswith("y")
+        assert "yy" not in patterns